@@ -34,6 +34,7 @@ def verify(dataset_path: str):
     """
     Verify given dataset conforms to the AVL convention.
     """
+    from collections import Counter
     from .verify import verify_dataset
     from .verify import WARNING
     from .verify import ERROR
@@ -42,8 +43,9 @@ def verify(dataset_path: str):
     if not issues:
         click.echo('Ok, no issues found.')
     else:
-        num_warnings = len([1 for level, _ in issues if level == WARNING])
-        num_errors = len([1 for level, _ in issues if level == ERROR])
+        counts = Counter(level for level, _ in issues)
+        num_warnings = counts[WARNING]
+        num_errors = counts[ERROR]
         click.echo(f'{num_errors} error(s)'
                    f' and {num_warnings} warnings(s) found:')
         for level, message in issues:
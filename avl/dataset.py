@@ -19,9 +19,11 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import functools
+import re
+from typing import Dict, Any, Tuple, List, Union, Optional
 
-from typing import Dict, Any, Tuple, List, Union
-
+import dask.array as da
 import numpy as np
 import pandas as pd
 import pyproj
@@ -29,6 +31,20 @@ import xarray as xr
 
 CRS_CRS84 = pyproj.crs.CRS.from_string("CRS84")
 
+# Pandas frequency aliases of fixed duration mapped to numpy time units
+_FIXED_TIME_RES_UNITS = dict(
+    D='D',
+    H='h', h='h',
+    T='m', min='m',
+    S='s', s='s',
+    L='ms', ms='ms',
+    U='us', us='us',
+    N='ns', ns='ns',
+)
+_FIXED_TIME_RES_PATTERN = re.compile(
+    r'^(\d*)(' + '|'.join(_FIXED_TIME_RES_UNITS.keys()) + r')$'
+)
+
 DEFAULT_METADATA = dict(
     Conventions="CF-1.7",
     title='AVL test dataset',
@@ -76,8 +92,10 @@ def new_dataset(
         Defaults to None (= automatic chunking).
     :param xy_names: Names of the x,y coordinate variables.
         Defaults to ('lon', 'lat).
-    :param xy_dtype: Data type of both x and y coordinate.
-        Defaults to 'float64'.
+    :param xy_dtype: Data type of both x and y coordinates and their
+        bounds. Defaults to 'float64'. 'float32' halves the coordinate
+        size, but at typical UTM northings its precision is only
+        about 0.5 meters.
     :param xy_units: Units of the x,y coordinates.
         Defaults to ('degrees_east', 'degrees_north').
     :param xy_start: Minimum x,y values.
@@ -136,13 +154,13 @@ def new_dataset(
     x_end = x_start + width * x_res
     y_end = y_start + height * y_res
 
-    x_res_05 = 0.5 * x_res
-    y_res_05 = 0.5 * y_res
+    # lower cell boundaries, shared by the cell centers and the bounds;
+    # computed in float64 and cast to xy_dtype afterwards
+    x_min_data = x_start + x_res * np.arange(width, dtype=np.float64)
+    y_min_data = y_start + y_res * np.arange(height, dtype=np.float64)
 
-    x_data = np.linspace(x_start + x_res_05, x_end - x_res_05,
-                         width, dtype=xy_dtype)
-    y_data = np.linspace(y_start + y_res_05, y_end - y_res_05,
-                         height, dtype=xy_dtype)
+    x_data = (x_min_data + 0.5 * x_res).astype(xy_dtype, copy=False)
+    y_data = (y_min_data + 0.5 * y_res).astype(xy_dtype, copy=False)
 
     x_var = xr.DataArray(x_data, dims=x_name, attrs=dict(units=x_units))
     y_var = xr.DataArray(y_data, dims=y_name, attrs=dict(units=y_units))
@@ -168,9 +186,16 @@ def new_dataset(
                                        freq=time_res,
                                        calendar=time_calendar).values
     else:
-        time_data_p1 = pd.date_range(start=time_start,
-                                     periods=time_periods + 1,
-                                     freq=time_res).values
+        time_res_delta = _get_fixed_time_delta(time_res)
+        if time_res_delta is not None:
+            # Let pandas parse the start, like pd.date_range() does
+            time_data_p1 = (pd.Timestamp(time_start).to_datetime64()
+                            + np.arange(time_periods + 1) * time_res_delta)
+        else:
+            # Calendar-based frequency such as months or years
+            time_data_p1 = pd.date_range(start=time_start,
+                                         periods=time_periods + 1,
+                                         freq=time_res).values
         time_data_p1 = time_data_p1.astype(dtype=time_dtype)
 
     time_delta = time_data_p1[1] - time_data_p1[0]
@@ -187,16 +212,10 @@ def new_dataset(
 
         bnds_dim = 'bnds'
 
-        x_bnds_data = np.zeros((width, 2), dtype=np.float64)
-        x_bnds_data[:, 0] = np.linspace(x_start, x_end - x_res,
-                                        width, dtype=xy_dtype)
-        x_bnds_data[:, 1] = np.linspace(x_start + x_res, x_end,
-                                        width, dtype=xy_dtype)
-        y_bnds_data = np.zeros((height, 2), dtype=np.float64)
-        y_bnds_data[:, 0] = np.linspace(y_start, y_end - x_res,
-                                        height, dtype=xy_dtype)
-        y_bnds_data[:, 1] = np.linspace(y_start + x_res, y_end,
-                                        height, dtype=xy_dtype)
+        x_bnds_data = np.stack([x_min_data, x_min_data + x_res],
+                               axis=1).astype(xy_dtype, copy=False)
+        y_bnds_data = np.stack([y_min_data, y_min_data + y_res],
+                               axis=1).astype(xy_dtype, copy=False)
         if inverse_y:
             y_bnds_data = y_bnds_data[::-1, ::-1]
 
@@ -210,10 +229,8 @@ def new_dataset(
         x_var.attrs['bounds'] = x_bnds_name
         y_var.attrs['bounds'] = y_bnds_name
 
-        time_bnds_data = np.zeros((time_periods, 2),
-                                  dtype=time_data_p1.dtype)
-        time_bnds_data[:, 0] = time_data_p1[:-1]
-        time_bnds_data[:, 1] = time_data_p1[1:]
+        time_bnds_data = np.stack([time_data_p1[:-1], time_data_p1[1:]],
+                                  axis=1)
         time_bnds_var = xr.DataArray(time_bnds_data,
                                      dims=(time_name, bnds_dim))
         time_bnds_var.encoding['units'] = time_units
@@ -243,40 +260,41 @@ def new_dataset(
         )
     )
 
+    chunks = {
+        x_name: 'auto',
+        y_name: 'auto',
+        time_name: 'auto',
+    }
+    if xy_tile_size is not None:
+        x_tile_size, y_tile_size = xy_tile_size
+        chunks.update({
+            x_name: x_tile_size,
+            y_name: y_tile_size,
+        })
+
     data_vars = {}
     if variables:
         dims = (time_name, y_name, x_name)
         shape = (time_periods, height, width)
+        var_chunks = tuple(chunks[dim] for dim in dims)
         for var_name, dtype, attrs in variables:
             attrs = dict(attrs or {})
             if crs is not None:
                 attrs['grid_mapping'] = 'crs'
             data_vars[var_name] = xr.DataArray(
-                np.zeros(shape, dtype=dtype),
+                da.zeros(shape, chunks=var_chunks, dtype=dtype),
                 dims=dims,
                 attrs=attrs
             )
 
     if crs is not None:
-        data_vars['crs'] = xr.DataArray(0, attrs=crs.to_cf())
+        data_vars['crs'] = xr.DataArray(0, attrs=dict(_get_cf_attrs(crs)))
 
-    dataset = xr.Dataset(data_vars=data_vars,
-                         coords=coords,
-                         attrs=attrs)
-
-    chunks = {
-        x_name: 'auto',
-        y_name: 'auto',
-        'time': 'auto',
-    }
-    if xy_tile_size is not None:
-        x_tile_size, y_tile_size = xy_tile_size
-        chunks.update({
-            x_name: x_tile_size,
-            y_name: y_tile_size,
-        })
-
-    return dataset.chunk(chunks=chunks)
+    # Only the data variables are chunked; coordinates and their
+    # bounds are small and stay as numpy arrays.
+    return xr.Dataset(data_vars=data_vars,
+                      coords=coords,
+                      attrs=attrs)
 
 
 def get_geospatial_attrs(
@@ -296,12 +314,11 @@ def get_geospatial_attrs(
         # center position + delta
         xm2 = xm1 + x_res
         ym2 = ym1 + y_res
-        transformer = pyproj.Transformer.from_crs(crs_from=crs,
-                                                  crs_to=CRS_CRS84)
-        xx, yy = transformer.transform((x1, x2, xm1, xm2),
-                                       (y1, y2, ym1, ym2))
-        lon_min, lon_max, lon_m1, lon_m2 = xx
-        lat_min, lat_max, lat_m1, lat_m2 = yy
+        transformer = _get_transformer(crs, CRS_CRS84)
+        xx, yy = transformer.transform(np.array([x1, x2, xm1, xm2]),
+                                       np.array([y1, y2, ym1, ym2]))
+        lon_min, lon_max, lon_m1, lon_m2 = xx.tolist()
+        lat_min, lat_max, lat_m1, lat_m2 = yy.tolist()
         # Estimate resolution (note, this may be VERY wrong)
         lon_res = abs(lon_m2 - lon_m1)
         lat_res = abs(lat_m2 - lat_m1)
@@ -340,6 +357,38 @@ def get_time_coverage_attrs(
 
 def from_crs84(coord: Tuple[float, float], crs_to: pyproj.CRS):
     x, y = coord
-    transformer = pyproj.Transformer.from_crs(crs_from=CRS_CRS84,
-                                              crs_to=crs_to)
+    transformer = _get_transformer(CRS_CRS84, crs_to)
     return transformer.transform(x, y)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_transformer(crs_from: pyproj.CRS,
+                     crs_to: pyproj.CRS) -> pyproj.Transformer:
+    # pyproj.CRS instances are hashable (by their WKT), so transformers
+    # are created only once per distinct CRS pair.
+    return pyproj.Transformer.from_crs(crs_from=crs_from,
+                                       crs_to=crs_to,
+                                       always_xy=True)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_cf_attrs(crs: pyproj.CRS) -> Dict[str, Any]:
+    # Callers must copy the result, it is shared between calls.
+    return crs.to_cf()
+
+
+def _get_fixed_time_delta(time_res: str) -> Optional[np.timedelta64]:
+    """
+    Get the duration of the pandas frequency string *time_res*,
+    e.g. '1D' or '6h'. Return None if the frequency has no fixed
+    duration, e.g. 'MS' or '1Y'.
+    """
+    match = _FIXED_TIME_RES_PATTERN.match(time_res)
+    if match is None:
+        return None
+    count, unit = match.groups()
+    count = int(count or 1)
+    if count == 0:
+        raise ValueError(f'invalid time resolution {time_res!r}:'
+                         f' duration must not be zero')
+    return np.timedelta64(count, _FIXED_TIME_RES_UNITS[unit])
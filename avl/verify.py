@@ -20,13 +20,13 @@
 # IN THE SOFTWARE.
 
 import collections
-from typing import Any, List, Union, Dict, Tuple, Callable
+import functools
+from typing import Any, List, Union, Dict, Tuple, Callable, Optional
 
 import numpy as np
-import pyproj
 import xarray as xr
 
-_EXPECTED_GLOBAL_ATTRS = [
+_EXPECTED_GLOBAL_ATTRS = (
     'Conventions',
     'title',
     'summary',
@@ -45,13 +45,15 @@ _EXPECTED_GLOBAL_ATTRS = [
     'geospatial_lat_max',
     'geospatial_lat_resolution',
     'geospatial_lat_units',
-]
+)
+_EXPECTED_GLOBAL_ATTRS_SET = frozenset(_EXPECTED_GLOBAL_ATTRS)
 
-_EXPECTED_VARIABLE_ATTRS = [
+_EXPECTED_VARIABLE_ATTRS = (
     'long_name',
     'standard_name',
     'units',
-]
+)
+_EXPECTED_VARIABLE_ATTRS_SET = frozenset(_EXPECTED_VARIABLE_ATTRS)
 
 WARNING = 'WARNING'
 ERROR = 'ERROR'
@@ -65,11 +67,14 @@ def verify_dataset(
         open_kwargs: Dict[str, Any] = None
 ) -> List[Issue]:
     if not isinstance(dataset, xr.Dataset):
-        open_kwargs = open_kwargs or {}
+        open_kwargs = dict(open_kwargs or {})
         open_kwargs.pop('decode_cf', None)
+        # Rules only read metadata and 1-D coordinates,
+        # so there is no need for dask arrays
+        open_kwargs.setdefault('chunks', None)
         dataset = xr.open_zarr(dataset,
                                decode_cf=False,
-                               **(open_kwargs or {}))
+                               **open_kwargs)
     all_issues = []
     for rule in get_rules():
         issues = rule(dataset)
@@ -78,161 +83,239 @@ def verify_dataset(
     return all_issues
 
 
-def get_rules() -> List[Rule]:
-    return [
-        check_global_attrs,
-        check_time_coord,
-        check_xy_coords,
-    ]
+def get_rules() -> Tuple[Rule, ...]:
+    return _RULES
 
 
 def check_global_attrs(ds: xr.Dataset) -> List[Issue]:
-    issues = []
-    for attr_name in _EXPECTED_GLOBAL_ATTRS:
-        issues += _check_global_attr(ds, attr_name)
-    return issues
+    missing = _EXPECTED_GLOBAL_ATTRS_SET - ds.attrs.keys()
+    if not missing:
+        return []
+    # Keep the order of _EXPECTED_GLOBAL_ATTRS for the reported issues
+    return [_warning(f'missing global attribute {attr_name!r}')
+            for attr_name in _EXPECTED_GLOBAL_ATTRS
+            if attr_name in missing]
 
 
 def check_time_coord(ds: xr.Dataset) -> List[Issue]:
     issues = []
-    issues += _check_variable(ds, 'time')
-    issues += _check_mono_inc(ds, 'time')
-
-    time_dim = 'time'
-    if 'time' in ds and ds.time.dims == (time_dim,):
-        for var_name, var in ds.variables.items():
-            if time_dim in var.dims and len(var.dims) > 1:
-                if var.dims[0] != time_dim:
-                    issues += _severe(f"first dimension of"
-                                      f" variable {var_name!r}"
-                                      f" must be {time_dim!r},"
-                                      f" but dimensions are {var.dims!r}")
-
+    issues.extend(_check_variable(ds, 'time'))
+    issues.extend(_check_mono_inc(ds, 'time'))
     return issues
 
 
 def check_xy_coords(ds: xr.Dataset) -> List[Issue]:
     issues = []
 
-    yx_dims = None
+    xy_ndim, lon_lat_ndim, yx_dims = _get_xy_coords_info(ds)
 
-    x = ds.get('x')
-    y = ds.get('y')
-    if x is not None and y is not None:
-        issues += _check_variable(ds, 'x')
-        issues += _check_variable(ds, 'y')
-        if x.ndim == 1 and y.ndim == 1:
-            yx_dims = 'y', 'x'
-            issues += _check_mono_inc(ds, 'x')
-            issues += _check_mono_inc_or_dec(ds, 'y')
-            issues += _check_crs(ds, 'crs')
+    if xy_ndim is not None:
+        issues.extend(_check_variable(ds, 'x'))
+        issues.extend(_check_variable(ds, 'y'))
+        if xy_ndim == 1:
+            issues.extend(_check_mono_inc(ds, 'x'))
+            issues.extend(_check_mono_inc_or_dec(ds, 'y'))
+            issues.extend(_check_crs(ds, 'crs'))
         else:
-            issues += _severe("coordinate variables 'x' and 'y' "
-                              "must both be 1-D")
-
-    lon = ds.get('lon')
-    lat = ds.get('lat')
-    if lon is not None and lat is not None:
-        issues += _check_variable(ds, 'lon')
-        issues += _check_variable(ds, 'lat')
-        if lon.ndim == 1 and lat.ndim == 1:
-            yx_dims = 'lat', 'lon'
-            issues += _check_mono_inc(ds, 'lon')
-            issues += _check_mono_inc_or_dec(ds, 'lat')
-        elif lon.ndim == 2 and lat.ndim == 2:
-            if lon.dims != ('y', 'x'):
-                issues += _severe("dimensions of 'lat' must be ('y', 'x')")
-            if lat.dims == ('y', 'x'):
-                issues += _severe("dimensions of 'lat' must be ('y', 'x')")
-            yx_dims = 'y', 'x'
+            issues.append(_severe("coordinate variables 'x' and 'y' "
+                                  "must both be 1-D"))
+
+    if lon_lat_ndim is not None:
+        issues.extend(_check_variable(ds, 'lon'))
+        issues.extend(_check_variable(ds, 'lat'))
+        if lon_lat_ndim == 1:
+            issues.extend(_check_mono_inc(ds, 'lon'))
+            issues.extend(_check_mono_inc_or_dec(ds, 'lat'))
+        elif lon_lat_ndim == 2:
+            if ds.variables['lon'].dims != ('y', 'x'):
+                issues.append(_severe("dimensions of 'lat'"
+                                      " must be ('y', 'x')"))
+            if ds.variables['lat'].dims == ('y', 'x'):
+                issues.append(_severe("dimensions of 'lat'"
+                                      " must be ('y', 'x')"))
         else:
-            issues += _severe("coordinate variables 'lon' and 'lat' "
-                              "must both be either 1-D or 2-D")
+            issues.append(_severe("coordinate variables 'lon' and 'lat' "
+                                  "must both be either 1-D or 2-D"))
 
     if yx_dims is None:
-        issues += _severe('no valid spatial coordinates found')
-    else:
+        issues.append(_severe('no valid spatial coordinates found'))
+
+    return issues
+
+
+def check_var_dims(ds: xr.Dataset) -> List[Issue]:
+    # Checks the dimension order of all variables in a single pass
+    # over the dataset's variables.
+    issues = []
+
+    time_dim = 'time'
+    if not ('time' in ds and ds.variables['time'].dims == (time_dim,)):
+        time_dim = None
+
+    _, _, yx_dims = _get_xy_coords_info(ds)
+    if yx_dims is not None:
         y_dim, x_dim = yx_dims
-        for var_name, var in ds.variables.items():
-            if y_dim in var.dims and x_dim in var.dims:
-                if var.dims[-2:] != yx_dims:
-                    issues += _severe(f"last two dimensions of"
+    else:
+        y_dim, x_dim = None, None
+
+    for var_name, var in ds.variables.items():
+        dims = var.dims
+        if len(dims) < 2:
+            # Scalars and 1-D coordinates have no dimension order
+            continue
+        if time_dim in dims:
+            if dims[0] != time_dim:
+                issues.append(_severe(f"first dimension of"
+                                      f" variable {var_name!r}"
+                                      f" must be {time_dim!r},"
+                                      f" but dimensions are {dims!r}"))
+        if y_dim in dims and x_dim in dims:
+            if dims[-2:] != yx_dims:
+                issues.append(_severe(f"last two dimensions of"
                                       f" variable {var_name!r}"
                                       f" must be {yx_dims!r},"
-                                      f" but dimensions are {var.dims!r}")
+                                      f" but dimensions are {dims!r}"))
 
     return issues
 
 
+_RULES = (
+    check_global_attrs,
+    check_time_coord,
+    check_xy_coords,
+    check_var_dims,
+)
+
+
+def _get_xy_coords_info(
+        ds: xr.Dataset
+) -> Tuple[Optional[int], Optional[int], Optional[Tuple[str, str]]]:
+    # Returns the common number of dimensions of the 'x' and 'y'
+    # coordinates, the same for 'lon' and 'lat', and the (y, x)
+    # dimension names of the spatial grid. A number of dimensions is
+    # None if the pair doesn't exist and 0 if the two differ in it.
+    # The dimension names are None if there is no valid pair.
+    xy_ndim = _get_coord_pair_ndim(ds, 'x', 'y')
+    lon_lat_ndim = _get_coord_pair_ndim(ds, 'lon', 'lat')
+
+    yx_dims = None
+    if xy_ndim == 1:
+        yx_dims = 'y', 'x'
+    if lon_lat_ndim == 1:
+        yx_dims = 'lat', 'lon'
+    elif lon_lat_ndim == 2:
+        yx_dims = 'y', 'x'
+
+    return xy_ndim, lon_lat_ndim, yx_dims
+
+
+def _get_coord_pair_ndim(ds: xr.Dataset,
+                         x_name: str,
+                         y_name: str) -> Optional[int]:
+    x_ndim = _get_coord_ndim(ds, x_name)
+    y_ndim = _get_coord_ndim(ds, y_name)
+    if x_ndim is None or y_ndim is None:
+        return None
+    return x_ndim if x_ndim == y_ndim else 0
+
+
+def _get_coord_ndim(ds: xr.Dataset, var_name: str) -> Optional[int]:
+    var = ds.variables.get(var_name)
+    if var is not None:
+        return var.ndim
+    # A bare dimension counts as 1-D coordinate, like xarray's virtual
+    # coordinate for it, so the missing variable gets reported
+    if var_name in ds.dims:
+        return 1
+    return None
+
+
 def _check_crs(ds, var_name):
+    # pyproj is imported lazily, it is only needed for datasets
+    # with projected x,y coordinates
+    import pyproj
     issues = _check_variable(ds, var_name)
     if var_name in ds:
         try:
-            pyproj.CRS.from_cf(ds[var_name].attrs)
+            _crs_from_cf(ds.variables[var_name].attrs)
         except pyproj.exceptions.ProjError as e:
-            issues += _severe(f"invalid {var_name!r} variable: {e}")
+            issues.append(_severe(f"invalid {var_name!r} variable: {e}"))
     return issues
 
 
+def _crs_from_cf(attrs: Dict[str, Any]):
+    import pyproj
+    # Lists (as read from Zarr JSON attributes) become tuples
+    # so that the attributes can serve as cache key
+    items = tuple(sorted((k, tuple(v) if isinstance(v, list) else v)
+                         for k, v in attrs.items()))
+    try:
+        hash(items)
+    except TypeError:
+        # E.g. numpy arrays as values, don't cache
+        return pyproj.CRS.from_cf(attrs)
+    return _crs_from_cf_items(items)
+
+
+@functools.lru_cache(maxsize=64)
+def _crs_from_cf_items(items: Tuple[Tuple[str, Any], ...]):
+    import pyproj
+    return pyproj.CRS.from_cf({k: list(v) if isinstance(v, tuple) else v
+                               for k, v in items})
+
+
 def _check_1d_coord(ds, var_name):
-    var = ds[var_name]
+    var = ds.variables[var_name]
     issues = []
     if var.dims != (var_name,):
-        issues += _severe(f"variable {var_name!r} must"
-                          f" have a single dimension {var_name!r}")
+        issues.append(_severe(f"variable {var_name!r} must"
+                              f" have a single dimension {var_name!r}"))
     return issues
 
 
 def _check_mono_inc(ds, var_name):
+    if var_name not in ds.variables:
+        # Missing variable is reported by _check_variable()
+        return []
     issues = _check_1d_coord(ds, var_name)
-    var = ds[var_name]
-    diff_var = var.diff(dim=var_name)
-    if np.issubdtype(diff_var.dtype, np.timedelta64):
-        diff_var = diff_var.astype(np.float64)
-    if not np.all(diff_var > 0):
-        issues += _severe(f"values of variable {var_name!r} must"
-                          " be strictly monotonically increasing")
+    values = ds.variables[var_name].values
+    if not np.all(values[:-1] < values[1:]):
+        issues.append(_severe(f"values of variable {var_name!r} must"
+                              " be strictly monotonically increasing"))
     return issues
 
 
 def _check_mono_inc_or_dec(ds, var_name):
+    if var_name not in ds.variables:
+        # Missing variable is reported by _check_variable()
+        return []
     issues = _check_1d_coord(ds, var_name)
-    var = ds[var_name]
-    diff_var = var.diff(dim=var_name)
-    if not (np.all(diff_var > 0) or np.all(diff_var < 0)):
-        issues += _severe(f"values of variable {var_name!r} must"
-                          " be strictly monotonically increasing or decreasing")
+    values = ds.variables[var_name].values
+    if not (np.all(values[:-1] < values[1:])
+            or np.all(values[:-1] > values[1:])):
+        issues.append(_severe(f"values of variable {var_name!r} must"
+                              " be strictly monotonically increasing"
+                              " or decreasing"))
     return issues
 
 
 def _check_variable(ds: xr.Dataset, var_name: str) -> List[Issue]:
     if var_name not in ds:
-        return _severe(f'missing variable {var_name!r}')
-    issues = []
-    for attr_name in _EXPECTED_VARIABLE_ATTRS:
-        issues += _check_variable_attr(ds, var_name, attr_name)
-    return issues
-
-
-def _check_variable_attr(ds: xr.Dataset,
-                         var_name: str,
-                         attr_name: str) -> List[Issue]:
-    if attr_name not in ds[var_name].attrs:
-        return _warning(f'missing attribute {attr_name!r}'
-                        f' in variable {var_name!r}')
-    return []
-
-
-def _check_global_attr(ds: xr.Dataset,
-                       attr_name: str) -> List[Issue]:
-    if attr_name not in ds.attrs:
-        return _warning(f'missing global attribute {attr_name!r}')
-    return []
+        return [_severe(f'missing variable {var_name!r}')]
+    attrs = ds.variables[var_name].attrs
+    missing = _EXPECTED_VARIABLE_ATTRS_SET - attrs.keys()
+    if not missing:
+        return []
+    # Keep the order of _EXPECTED_VARIABLE_ATTRS for the reported issues
+    return [_warning(f'missing attribute {attr_name!r}'
+                     f' in variable {var_name!r}')
+            for attr_name in _EXPECTED_VARIABLE_ATTRS
+            if attr_name in missing]
 
 
-def _warning(msg: str) -> List[Issue]:
-    return [(WARNING, msg)]
+def _warning(msg: str) -> Issue:
+    return WARNING, msg
 
 
-def _severe(msg: str) -> List[Issue]:
-    return [(ERROR, msg)]
+def _severe(msg: str) -> Issue:
+    return ERROR, msg